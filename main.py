@@ -1,14 +1,29 @@
 import os
+from typing import Final
 import runpod
-from model_downloader import download_model_from_s3
 
-# Configuration - Set these as environment variables in RunPod template
-CONFIG = {
-    'S3_BUCKET': os.getenv('S3_BUCKET', 'rd0cg4jfje'),
-    'S3_ENDPOINT': os.getenv('S3_ENDPOINT', 'https://s3api-eu-cz-1.runpod.io'),
-    'S3_REGION': os.getenv('S3_REGION', 'eu-cz-1'),
-    'MODEL_PATH': '/model'
-}
+# Configuration - Set these as environment variables in RunPod template.
+# Resolved once at import; they are fixed for the life of the container.
+S3_BUCKET: Final = os.getenv('S3_BUCKET', 'rd0cg4jfje')
+S3_ENDPOINT: Final = os.getenv('S3_ENDPOINT', 'https://s3api-eu-cz-1.runpod.io')
+S3_REGION: Final = os.getenv('S3_REGION', 'eu-cz-1')
+MODEL_PATH: Final = '/model'
+
+# Created once per container and reused by every job it serves
+downloader = None
+
+def get_downloader():
+    """Return the worker's ModelDownloader, creating it on first use"""
+    global downloader
+    if downloader is None:
+        # Imported here so handler-only cold starts skip boto3 entirely
+        from model_downloader import ModelDownloader
+        downloader = ModelDownloader(
+            bucket_name=S3_BUCKET,
+            endpoint_url=S3_ENDPOINT,
+            region=S3_REGION
+        )
+    return downloader
 
 def initialize_worker():
     """Initialize the worker by downloading the model"""
@@ -20,11 +35,7 @@ def initialize_worker():
         print("ℹ️ Please set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY")
     
     # Download model from S3
-    # success = download_model_from_s3(
-    #     bucket_name=CONFIG['S3_BUCKET'],
-    #     endpoint_url=CONFIG['S3_ENDPOINT'],
-    #     region=CONFIG['S3_REGION']
-    # )
+    # success = get_downloader().download_model()
     
     # if not success:
     #     raise RuntimeError("Failed to download model from S3")
@@ -32,10 +43,10 @@ def initialize_worker():
     print("✅ Model downloaded successfully")
     
     # Load your actual model here
-    # Example: model = load_your_model(CONFIG['MODEL_PATH'])
-    print(f"📁 Model available at: {CONFIG['MODEL_PATH']}")
+    # Example: model = load_your_model(MODEL_PATH)
+    print(f"📁 Model available at: {MODEL_PATH}")
     
-    return {"status": "ready", "model_path": CONFIG['MODEL_PATH']}
+    return {"status": "ready", "model_path": MODEL_PATH}
 
 def handler(job):
     """Handle incoming inference requests"""
@@ -47,7 +58,7 @@ def handler(job):
         
         return {
             "status": "success",
-            "model_used": CONFIG['MODEL_PATH'],
+            "model_used": MODEL_PATH,
             "result": f"Processed input: {input_data}"
         }
         
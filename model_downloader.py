@@ -1,23 +1,183 @@
 import os
 import boto3
+import botocore.session
 import time
-import requests
+import queue
+import threading
+import tarfile
+import posixpath
+from boto3.s3.transfer import TransferConfig
+from s3transfer.manager import TransferManager
+from s3transfer.subscribers import BaseSubscriber
+from s3transfer.utils import S3_RETRYABLE_DOWNLOAD_ERRORS
 from botocore.client import Config
-from botocore.exceptions import NoCredentialsError, ClientError
-from tqdm import tqdm
-import json
-from pathlib import Path
+from botocore.exceptions import NoCredentialsError, ClientError, BotoCoreError, ResponseStreamingError
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Connection pool shared by every download thread
+MAX_POOL_CONNECTIONS = 128
+
+# Ranged GETs per large file; kept low since files are also fetched in parallel
+PER_FILE_CONCURRENCY = 4
+
+# Concurrent file downloads, sized so workers * per-file threads fit the pool
+MAX_DOWNLOAD_WORKERS = MAX_POOL_CONNECTIONS // PER_FILE_CONCURRENCY
+
+# Multipart settings for large model shards
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=PER_FILE_CONCURRENCY,
+    max_io_queue=1000,
+    io_chunksize=1024 * 1024,
+    use_threads=True
+)
+
+# Userspace buffer between the transfer manager and the destination file
+WRITE_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Read size when copying a single-GET response body to disk
+STREAM_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Errors while reading a response body that are worth another GET; botocore
+# reports dropped connections mid-body as ResponseStreamingError, which the
+# pinned s3transfer does not include
+STREAM_RETRYABLE_ERRORS = S3_RETRYABLE_DOWNLOAD_ERRORS + (ResponseStreamingError,)
+
+# Previous runs with more files than this pre-scan model_path with scandir;
+# smaller (or first) runs let each worker stat its own file instead
+PRESCAN_MIN_FILES = 10000
+
+# Optional bundle of the model's small files, packed once when the model is
+# uploaded; fetching it replaces one GET per small file with a single GET
+SMALL_FILES_ARCHIVE = 'small.tar'
+
+# Throughput the CRT client tunes its connection count for (RunPod NIC)
+CRT_TARGET_THROUGHPUT_GBPS = 10.0
+
+# Minimum seconds between two concurrency cuts, so one burst of 503s halves once
+THROTTLE_COOLDOWN = 1.0
+
+# (botocore session, S3 client, CRT manager, limiter) shared by every
+# downloader in this process, keyed by endpoint and access key
+_S3_CLIENTS = {}
+_S3_CLIENTS_LOCK = threading.Lock()
+
+class FrozenCredentialProvider:
+    """Credential provider that always returns one resolved Credentials object"""
+    
+    def __init__(self, credentials):
+        self._credentials = credentials
+    
+    def load_credentials(self):
+        return self._credentials
+
+class ProvideSizeSubscriber(BaseSubscriber):
+    """Hand the listed object size to s3transfer so it skips its HEAD request"""
+    
+    def __init__(self, size):
+        self.size = size
+    
+    def on_queued(self, future, **kwargs):
+        future.meta.provide_transfer_size(self.size)
+
+class HighWaterMarkWriter:
+    """Seekable file wrapper that records the furthest offset written
+    
+    A preallocated file already has its final length, so this is what
+    tells how much of it the transfer actually filled.
+    """
+    
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.end = 0
+    
+    def seekable(self):
+        return True
+    
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self._fileobj.seek(offset, whence)
+    
+    def tell(self):
+        return self._fileobj.tell()
+    
+    def write(self, data):
+        written = self._fileobj.write(data)
+        self.end = max(self.end, self._fileobj.tell())
+        return written
+
+class AdaptiveConcurrencyLimiter:
+    """Bound in-flight downloads with AIMD: halve on throttling, then regrow
+    by one slot after each window of `limit` successful downloads"""
+    
+    def __init__(self, max_limit, cooldown=THROTTLE_COOLDOWN):
+        self.max_limit = max_limit
+        self.limit = max_limit
+        self.active = 0
+        self._cooldown = cooldown
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+    
+    def __enter__(self):
+        with self._cond:
+            while self.active >= self.limit:
+                self._cond.wait()
+            self.active += 1
+        return self
+    
+    def __exit__(self, *exc_info):
+        with self._cond:
+            self.active -= 1
+            self._cond.notify()
+    
+    def record_success(self):
+        with self._cond:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.max_limit:
+                self.limit += 1
+                self._successes = 0
+                self._cond.notify()
+    
+    def on_needs_retry(self, response=None, **kwargs):
+        """botocore hook: report 503 Slow Down responses as throttling"""
+        if response is not None and response[0] is not None and response[0].status_code == 503:
+            self.record_throttle()
+    
+    def record_throttle(self):
+        now = time.monotonic()
+        with self._cond:
+            if now - self._last_decrease < self._cooldown:
+                return
+            self.limit = max(1, self.limit // 2)
+            self._successes = 0
+            self._last_decrease = now
+            print(f"⚠️  S3 throttling, reducing concurrency to {self.limit}")
 
 class ModelDownloader:
+    # Immutable client config shared by every instance and thread
+    S3_CONFIG = Config(
+        signature_version='s3v4',
+        retries={'mode': 'adaptive', 'max_attempts': 5},
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True
+    )
+    
     def __init__(self, bucket_name, endpoint_url, region):
         self.bucket_name = bucket_name
         self.endpoint_url = endpoint_url
         self.region = region
-        self.s3 = self._create_s3_client()
+        self.session, self.s3, self.crt_manager, self.limiter = self._create_s3_client()
         self.model_path = "/model"
         
     def _create_s3_client(self):
-        """Create S3 client with proper configuration for RunPod"""
+        """Return the process-wide (session, S3 client, CRT manager or None,
+        limiter) for this endpoint, creating them once
+        
+        Credentials are read from the environment once and frozen on the
+        session, so worker threads never walk the credential chain.
+        """
         try:
             # Check if we're in RunPod environment (credentials should be set via env vars)
             access_key = os.getenv('AWS_ACCESS_KEY_ID')
@@ -26,41 +186,80 @@ class ModelDownloader:
             if not access_key or not secret_key:
                 print("⚠️  AWS credentials not found in environment variables")
                 print("ℹ️  Make sure AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY are set")
-                return None
+                return None, None, None, AdaptiveConcurrencyLimiter(MAX_DOWNLOAD_WORKERS)
             
-            return boto3.client('s3',
-                            endpoint_url=self.endpoint_url,
-                            region_name=self.region,
-                            aws_access_key_id=access_key,
-                            aws_secret_access_key=secret_key,
-                            config=Config(
-                                signature_version='s3v4',
-                                retries={'max_attempts': 3},
-                                max_pool_connections=50
-                            ))
+            cache_key = (self.endpoint_url, self.region, access_key)
+            with _S3_CLIENTS_LOCK:
+                if cache_key not in _S3_CLIENTS:
+                    session = botocore.session.get_session()
+                    session.set_credentials(access_key, secret_key)
+                    client = boto3.Session(botocore_session=session).client('s3',
+                                    endpoint_url=self.endpoint_url,
+                                    region_name=self.region,
+                                    use_ssl=True,
+                                    verify=True,
+                                    config=self.S3_CONFIG)
+                    # One limiter per endpoint, fed by a hook registered once on
+                    # its client; needs-retry calls every handler, so it sees
+                    # each attempt alongside botocore's own retry handler
+                    limiter = AdaptiveConcurrencyLimiter(MAX_DOWNLOAD_WORKERS)
+                    client.meta.events.register('needs-retry.s3.GetObject',
+                                                limiter.on_needs_retry,
+                                                unique_id='adaptive-concurrency-throttle')
+                    _S3_CLIENTS[cache_key] = (session, client,
+                                              self._create_crt_manager(session),
+                                              limiter)
+                return _S3_CLIENTS[cache_key]
         except Exception as e:
             print(f"Error creating S3 client: {e}")
             raise
     
-    def download_file(self, key, local_path):
-        """Download a single file with progress bar"""
+    def _create_crt_manager(self, session):
+        """Create a CRT transfer manager, or None to use the classic client"""
         try:
-            # Get file size for progress bar
-            head = self.s3.head_object(Bucket=self.bucket_name, Key=key)
-            file_size = head['ContentLength']
-            
-            # Create directory if needed
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            # Native transfer client; installed via boto3[crt]
+            from s3transfer.crt import (
+                BotocoreCRTRequestSerializer,
+                CRTTransferManager,
+                create_s3_crt_client
+            )
+        except ImportError:
+            return None
+        try:
+            crt_client = create_s3_crt_client(
+                self.region,
+                botocore_credential_provider=FrozenCredentialProvider(session.get_credentials()),
+                target_throughput=CRT_TARGET_THROUGHPUT_GBPS * 1e9 / 8
+            )
+            serializer = BotocoreCRTRequestSerializer(session, {
+                'region_name': self.region,
+                'endpoint_url': self.endpoint_url
+            })
+            return CRTTransferManager(crt_client, serializer)
+        except Exception as e:
+            print(f"⚠️  CRT transfer client unavailable, using classic transfers: {e}")
+            return None
+    
+    def download_file(self, key, local_path, file_size):
+        """Download a single file (safe to call from worker threads)
+        
+        file_size is the Size reported by the bucket listing. The classic
+        paths use it instead of a HEAD request per file; the CRT client
+        learns the size from its first ranged GET. The parent directory of
+        local_path must already exist; download_model creates each one once.
+        """
+        try:
+            if self.crt_manager is not None:
+                self._download_crt(key, local_path)
+            elif file_size < TRANSFER_CONFIG.multipart_threshold:
+                self._download_streamed(key, local_path)
+            else:
+                self._download_preallocated(key, local_path, file_size)
             
-            # Download with progress bar
-            with tqdm(total=file_size, unit='B', unit_scale=True, 
-                     desc=os.path.basename(key), ncols=80) as pbar:
-                self.s3.download_file(
-                    Bucket=self.bucket_name,
-                    Key=key,
-                    Filename=local_path,
-                    Callback=lambda bytes_transferred: pbar.update(bytes_transferred)
-                )
+            local_size = os.path.getsize(local_path)
+            if local_size != file_size:
+                print(f"Size mismatch for {key}: expected {file_size}, got {local_size}")
+                return False
                 
             return True
             
@@ -71,35 +270,202 @@ class ModelDownloader:
             print(f"Unexpected error downloading {key}: {e}")
             return False
     
+    def _download_crt(self, key, local_path):
+        """Download through the CRT client, reporting throttling to the limiter
+        
+        CRT sends its own HTTP requests, so the botocore needs-retry hook
+        never sees them. CRT retries throttled parts itself; a 503 that
+        still fails the transfer is fed to the limiter here instead.
+        """
+        try:
+            self.crt_manager.download(self.bucket_name, key, local_path).result()
+        except Exception as e:
+            status = getattr(e, 'status_code', None)
+            if isinstance(e, ClientError):
+                status = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+            if status == 503:
+                self.limiter.record_throttle()
+            raise
+    
+    def _download_if_missing(self, key, local_path, file_size, check_local):
+        """Worker task: stat the local copy first, returning None if it is complete"""
+        if check_local:
+            try:
+                if os.stat(local_path).st_size == file_size:
+                    return None
+            except OSError:
+                pass
+        with self.limiter:
+            success = self.download_file(key, local_path, file_size)
+        if success:
+            self.limiter.record_success()
+        return success
+    
+    def _download_streamed(self, key, local_path):
+        """Copy a single GetObject body to disk in large chunks
+        
+        botocore only retries until the response headers arrive, so errors
+        while reading the body restart the GET into a truncated .part file,
+        up to the same attempt limit s3transfer uses.
+        """
+        part_path = local_path + '.part'
+        attempts = TRANSFER_CONFIG.num_download_attempts
+        try:
+            for attempt in range(1, attempts + 1):
+                body = self.s3.get_object(Bucket=self.bucket_name, Key=key)['Body']
+                try:
+                    with open(part_path, 'wb') as f:
+                        while chunk := body.read(STREAM_CHUNK_SIZE):
+                            f.write(chunk)
+                    break
+                except STREAM_RETRYABLE_ERRORS as e:
+                    if attempt == attempts:
+                        raise
+                    print(f"⚠️  Retrying {key} after read error: {e}")
+                finally:
+                    body.close()
+            os.replace(part_path, local_path)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+    
+    def _download_preallocated(self, key, local_path, file_size):
+        """Stream an object into a preallocated temp file, then move it into place"""
+        part_path = local_path + '.part'
+        fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            # Reserve the blocks up front so the write stream never extends the file
+            if file_size and hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(fd, 0, file_size)
+            with os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                writer = HighWaterMarkWriter(f)
+                # One manager per file keeps PER_FILE_CONCURRENCY ranged GETs
+                # per download; a shared one would cap them process-wide
+                with TransferManager(self.s3, TRANSFER_CONFIG) as manager:
+                    manager.download(
+                        self.bucket_name, key, writer,
+                        subscribers=[ProvideSizeSubscriber(file_size)]
+                    ).result()
+            # Drop any reserved tail the transfer never reached, so a short
+            # object fails the size check instead of passing as zero padding
+            os.truncate(part_path, writer.end)
+            os.replace(part_path, local_path)
+        except BaseException:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+    
+    def _warm_connection(self):
+        """Open a pooled TLS connection before the worker threads start"""
+        try:
+            self.s3.head_bucket(Bucket=self.bucket_name)
+        except (ClientError, BotoCoreError) as e:
+            print(f"⚠️  Could not reach bucket {self.bucket_name}: {e}")
+    
+    def _extract_small_files(self):
+        """Unpack SMALL_FILES_ARCHIVE into model_path, returning {key: size} extracted
+        
+        Only members below the multipart threshold are unpacked. Larger
+        files are downloaded while the archive streams, so extracting them
+        too would race with that download on the same path.
+        """
+        try:
+            body = self.s3.get_object(Bucket=self.bucket_name, Key=SMALL_FILES_ARCHIVE)['Body']
+        except ClientError as e:
+            if e.response['Error']['Code'] not in ('NoSuchKey', '404'):
+                print(f"Error fetching {SMALL_FILES_ARCHIVE}: {e}")
+            return {}
+        except BotoCoreError as e:
+            print(f"Error fetching {SMALL_FILES_ARCHIVE}: {e}")
+            return {}
+        
+        extracted = {}
+        try:
+            # Stream mode reads members straight off the response body
+            with tarfile.open(fileobj=body, mode='r|') as tar:
+                for member in tar:
+                    if member.isfile() and member.size < TRANSFER_CONFIG.multipart_threshold:
+                        tar.extract(member, self.model_path, filter='data')
+                        extracted[posixpath.normpath(member.name)] = member.size
+        except (tarfile.TarError, OSError, BotoCoreError) as e:
+            # Members not unpacked yet fall back to per-file downloads
+            print(f"⚠️  Failed to unpack {SMALL_FILES_ARCHIVE} after {len(extracted)} files: {e}")
+        else:
+            print(f"📦 Unpacked {len(extracted)} files from {SMALL_FILES_ARCHIVE}")
+        finally:
+            body.close()
+        
+        return extracted
+    
+    def _previous_small_files(self, previous):
+        """Return the previous run's unpacked {key: size} bundle contents if
+        that run completed and every file is still on disk, else None"""
+        if not previous or previous.get('failed_downloads') or not previous.get('listing_complete'):
+            return None
+        small_files = previous.get('small_files')
+        if small_files is None:
+            return None
+        for key, size in small_files.items():
+            try:
+                if os.stat(os.path.join(self.model_path, key)).st_size != size:
+                    return None
+            except OSError:
+                return None
+        return small_files
+    
+    def _scan_existing(self):
+        """Map each file under model_path (as a bucket-style key) to its size"""
+        existing = {}
+        stack = [(self.model_path, '')]
+        while stack:
+            path, prefix = stack.pop()
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, f"{prefix}{entry.name}/"))
+                        elif entry.is_file(follow_symlinks=False):
+                            existing[prefix + entry.name] = entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+        return existing
+    
+    def iter_bucket_contents(self):
+        """Yield (key, size) for each file in the bucket as pages are listed
+        
+        Only the two fields the downloader uses are kept, so the rest of
+        each listing entry can be freed with its page.
+        """
+        paginator = self.s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name):
+            for obj in page.get('Contents', ()):
+                yield obj['Key'], obj['Size']
+    
     def list_bucket_contents(self):
         """List all files in the bucket"""
         try:
-            objects = []
-            continuation_token = None
-            
-            while True:
-                if continuation_token:
-                    response = self.s3.list_objects_v2(
-                        Bucket=self.bucket_name,
-                        ContinuationToken=continuation_token
-                    )
-                else:
-                    response = self.s3.list_objects_v2(Bucket=self.bucket_name)
-                
-                if 'Contents' in response:
-                    objects.extend(response['Contents'])
-                
-                if not response.get('IsTruncated'):
-                    break
-                    
-                continuation_token = response.get('NextContinuationToken')
-            
-            return objects
+            return list(self.iter_bucket_contents())
             
-        except ClientError as e:
+        except (ClientError, BotoCoreError) as e:
             print(f"Error listing bucket contents: {e}")
             return []
     
+    def _enqueue_bucket_contents(self, object_queue, listing_failed):
+        """Push listed files onto the queue, followed by a None sentinel
+        
+        listing_failed is set before the sentinel if any page could not be
+        listed, so the consumer knows the file list is incomplete.
+        """
+        try:
+            for item in self.iter_bucket_contents():
+                object_queue.put(item)
+        except (ClientError, BotoCoreError) as e:
+            print(f"Error listing bucket contents: {e}")
+            listing_failed.set()
+        finally:
+            object_queue.put(None)
+    
     def download_model(self):
         """Main method to download entire model"""
         print(f"🚀 Starting model download from {self.bucket_name}")
@@ -108,50 +474,143 @@ class ModelDownloader:
         # Create model directory
         os.makedirs(self.model_path, exist_ok=True)
         
-        # List files in bucket
+        self._warm_connection()
+        
+        # List files in a background thread so downloads start with the first page
         print("📋 Listing files in bucket...")
-        objects = self.list_bucket_contents()
+        object_queue = queue.Queue()
+        listing_failed = threading.Event()
+        lister = threading.Thread(target=self._enqueue_bucket_contents,
+                                  args=(object_queue, listing_failed), daemon=True)
+        lister.start()
         
-        if not objects:
-            print("❌ No files found in bucket")
-            return False
+        # For large buckets, gather sizes left by a previous run in one directory
+        # walk; otherwise each worker stats its own file alongside the downloads
+        previous = self.get_model_info()
+        prescan = previous is not None and previous.get('total_files', 0) > PRESCAN_MIN_FILES
+        existing = self._scan_existing() if prescan else {}
         
-        print(f"📊 Found {len(objects)} files to download")
+        # Reuse the previous run's bundle contents if they are all still on
+        # disk; otherwise the bundle is fetched in the pool like any download
+        small_files = self._previous_small_files(previous)
+        if small_files is not None:
+            existing.update(small_files)
         
-        # Download each file
+        # Parent directories created so far, so each is made only once
+        created_dirs = {self.model_path}
+        
+        # Download files concurrently, sharing the single S3 client
+        total_files = 0
         success_count = 0
         failed_count = 0
         
-        for obj in objects:
-            key = obj['Key']
-            local_file_path = os.path.join(self.model_path, key)
-            
-            # Skip if file already exists and is the same size
-            if os.path.exists(local_file_path):
-                local_size = os.path.getsize(local_file_path)
-                if local_size == obj['Size']:
-                    print(f"✅ Already exists: {key}")
-                    success_count += 1
-                    continue
-            
-            print(f"⬇️  Downloading: {key}")
-            if self.download_file(key, local_file_path):
-                success_count += 1
-            else:
-                failed_count += 1
+        from tqdm import tqdm
+        
+        with tqdm(total=0, unit='file', ncols=80) as pbar:
+            with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+                futures = {}
+                
+                def schedule(key, size):
+                    """Skip one listed file if present, else submit its download"""
+                    nonlocal success_count, failed_count
+                    local_file_path = os.path.join(self.model_path, key)
+                    
+                    # Skip if file already exists and is the same size
+                    if existing.get(key) == size:
+                        pbar.write(f"✅ Already exists: {key}")
+                        success_count += 1
+                        pbar.update(1)
+                        return
+                    
+                    parent_dir = os.path.dirname(local_file_path)
+                    if parent_dir not in created_dirs:
+                        try:
+                            os.makedirs(parent_dir, exist_ok=True)
+                        except OSError as e:
+                            # e.g. a local file where the key needs a directory
+                            pbar.write(f"Error creating directory for {key}: {e}")
+                            failed_count += 1
+                            pbar.update(1)
+                            return
+                        created_dirs.add(parent_dir)
+                    
+                    futures[executor.submit(self._download_if_missing, key, local_file_path,
+                                            size, not prescan)] = key
+                
+                # Single-GET sized files may be in the bundle, so they wait for
+                # it to unpack; larger files start downloading straight away
+                archive_future = None if small_files is not None else executor.submit(self._extract_small_files)
+                deferred = []
+                
+                while (item := object_queue.get()) is not None:
+                    if item[0] == SMALL_FILES_ARCHIVE:
+                        continue
+                    
+                    total_files += 1
+                    pbar.total = total_files
+                    pbar.refresh()
+                    
+                    if archive_future is not None and item[1] < TRANSFER_CONFIG.multipart_threshold:
+                        deferred.append(item)
+                    else:
+                        schedule(*item)
+                    
+                    if archive_future is not None and archive_future.done():
+                        small_files = archive_future.result()
+                        existing.update(small_files)
+                        archive_future = None
+                        for deferred_item in deferred:
+                            schedule(*deferred_item)
+                        deferred.clear()
+                
+                if archive_future is not None:
+                    small_files = archive_future.result()
+                    existing.update(small_files)
+                    for deferred_item in deferred:
+                        schedule(*deferred_item)
+                
+                if listing_failed.is_set():
+                    # Files after the failed page were never seen, so this run
+                    # cannot be complete
+                    pbar.write(f"❌ Bucket listing failed after {total_files} files")
+                    failed_count += 1
+                elif not total_files:
+                    pbar.write("❌ No files found in bucket")
+                    return False
+                else:
+                    pbar.write(f"📊 Found {total_files} files")
+                
+                for future in as_completed(futures):
+                    key = futures[future]
+                    result = future.result()
+                    if result is None:
+                        pbar.write(f"✅ Already exists: {key}")
+                        success_count += 1
+                    elif result:
+                        pbar.write(f"⬇️  Downloaded: {key}")
+                        success_count += 1
+                    else:
+                        failed_count += 1
+                    pbar.update(1)
         
         # Create a metadata file
         metadata = {
             'download_time': time.time(),
             'bucket_name': self.bucket_name,
             'endpoint_url': self.endpoint_url,
-            'total_files': len(objects),
+            'total_files': total_files,
             'successful_downloads': success_count,
-            'failed_downloads': failed_count
+            'failed_downloads': failed_count,
+            'listing_complete': not listing_failed.is_set(),
+            'small_files': small_files
         }
         
-        with open(os.path.join(self.model_path, 'download_metadata.json'), 'w') as f:
-            json.dump(metadata, f, indent=2)
+        # Write through a temp file so an interrupted write never leaves a
+        # truncated metadata file behind
+        metadata_file = os.path.join(self.model_path, 'download_metadata.json')
+        with open(metadata_file + '.part', 'wb') as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+        os.replace(metadata_file + '.part', metadata_file)
         
         print(f"\n🎉 Download completed!")
         print(f"✅ Successful: {success_count}")
@@ -163,8 +622,12 @@ class ModelDownloader:
         """Get information about the downloaded model"""
         metadata_file = os.path.join(self.model_path, 'download_metadata.json')
         if os.path.exists(metadata_file):
-            with open(metadata_file, 'r') as f:
-                return json.load(f)
+            try:
+                with open(metadata_file, 'rb') as f:
+                    return orjson.loads(f.read())
+            except (orjson.JSONDecodeError, OSError) as e:
+                # Treat unreadable metadata (e.g. a write cut short) as no previous run
+                print(f"⚠️  Ignoring unreadable {metadata_file}: {e}")
         return None
 
 # Utility function for easy usage